@@ -184,6 +184,36 @@ class EvaluationConfig:
             The name of the file containing the model weights, if local models are
             used. If None, the weight file will be automatically detected as the first
             "*.bin" file in the model directory. Defaults to None.
+        compile:
+            Whether to compile PyTorch models with `torch.compile` after loading, so
+            repeated inference batches run through the fused kernel path. The first
+            batch triggers the compilation, and the batch size should be kept static
+            to avoid recompilations. Defaults to False.
+        attn_implementation:
+            The attention backend to use for PyTorch models, such as "sdpa" or
+            "flash_attention_2". If None then the choice is left to `transformers`,
+            which prefers scaled dot-product attention when the architecture
+            supports it. Defaults to None.
+        torch_dtype:
+            The dtype to load PyTorch models in. Can be "float32", "float16",
+            "bfloat16" or "int8", where "int8" dynamically quantizes the linear
+            layers of the model after loading, which only takes effect when
+            evaluating on CPU. Halving the precision halves the memory traffic of
+            the model at a small cost in accuracy. If None then the model is loaded
+            in its default dtype. Defaults to None.
+        fast_download:
+            Whether to download models from the Hugging Face Hub through the Rust-based
+            `hf_transfer` package, which speeds up downloads of large models on fast
+            connections. Requires the package to be installed, which can be done by
+            installing this package with the `fast_download` extra. Defaults to False.
+        parallel_model_loading:
+            Whether to load the weight shards of PyTorch models in parallel, which
+            speeds up loading of large multi-shard checkpoints. Defaults to True.
+        parallel_loading_workers:
+            The number of workers to use when loading weight shards in parallel. If
+            None, the number of workers will be set to the number of CPU cores, capped
+            at 8. Only relevant if `parallel_model_loading` is set to True. Defaults to
+            None.
         testing:
             Whether a unit test is being run. Defaults to False.
     """
@@ -200,6 +230,12 @@ class EvaluationConfig:
     only_return_log: bool = False
     architecture_fname: str | None = None
     weight_fname: str | None = None
+    compile: bool = False
+    attn_implementation: str | None = None
+    torch_dtype: str | None = None
+    fast_download: bool = False
+    parallel_model_loading: bool = True
+    parallel_loading_workers: int | None = None
     testing: bool = False
 
     @property
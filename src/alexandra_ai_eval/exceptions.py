@@ -1,4 +1,11 @@
-"""Custom exceptions used in the project."""
+"""Custom exceptions used in the project.
+
+The exceptions which build their message from other attributes only format it when
+the message is actually read, as exceptions on hot paths are often raised and caught
+without ever being displayed. The raw attributes are still passed on to the base
+`Exception`, so the exceptions can be pickled, such as when they cross the process
+boundary of a `datasets` worker.
+"""
 
 from .enums import Framework
 
@@ -14,55 +21,71 @@ class InvalidEvaluation(Exception):
 class ModelDoesNotExist(Exception):
     def __init__(self, model_id: str, message: str = ""):
         self.model_id = model_id
-        self.message = (
-            message
-            if message
-            else (
-                f"The model ID '{model_id}' is not a valid model ID on the Hugging "
-                "Face Hub, nor is it a valid spaCy model ID. In case of a Hugging "
-                "Face model, please check the model ID, and try again. In case of a "
-                "spaCy model, please make sure that you have spaCy installed, and "
-                "that the model is installed on your system."
-            )
+        self._message = message
+        super().__init__(model_id, message)
+
+    @property
+    def message(self) -> str:
+        return self._message or (
+            f"The model ID '{self.model_id}' is not a valid model ID on the Hugging "
+            "Face Hub, nor is it a valid spaCy model ID. In case of a Hugging "
+            "Face model, please check the model ID, and try again. In case of a "
+            "spaCy model, please make sure that you have spaCy installed, and "
+            "that the model is installed on your system."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ModelIsPrivate(Exception):
     def __init__(self, model_id: str, message: str = ""):
         self.model_id = model_id
-        self.message = (
-            message
-            if message
-            else (
-                f"The model ID '{model_id}' is a private model on the Hugging Face "
-                "Hub. Please make sure that you have the correct credentials, are "
-                "logged in to the Hugging Face Hub via `huggingface-cli login`, and "
-                "ensure that `token` is set (`--token` in the CLI)."
-            )
+        self._message = message
+        super().__init__(model_id, message)
+
+    @property
+    def message(self) -> str:
+        return self._message or (
+            f"The model ID '{self.model_id}' is a private model on the Hugging Face "
+            "Hub. Please make sure that you have the correct credentials, are "
+            "logged in to the Hugging Face Hub via `huggingface-cli login`, and "
+            "ensure that `token` is set (`--token` in the CLI)."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ModelFetchFailed(Exception):
     def __init__(self, model_id: str, error_msg: str, message: str = ""):
         self.model_id = model_id
         self.error_msg = error_msg
-        if message != "":
-            self.message = message
-        else:
-            self.message = (
-                f"Download of {model_id} from the Hugging Face Hub failed, with "
-                f"the following error message: {self.error_msg}."
-            )
-        super().__init__(self.message)
+        self._message = message
+        super().__init__(model_id, error_msg, message)
+
+    @property
+    def message(self) -> str:
+        return self._message or (
+            f"Download of {self.model_id} from the Hugging Face Hub failed, with "
+            f"the following error message: {self.error_msg}."
+        )
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidFramework(Exception):
     def __init__(self, framework: Framework | str):
         self.framework = framework
-        self.message = f"The framework {str(framework)} is not supported."
-        super().__init__(self.message)
+        super().__init__(framework)
+
+    @property
+    def message(self) -> str:
+        return f"The framework {str(self.framework)} is not supported."
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class PreprocessingFailed(Exception):
@@ -77,11 +100,17 @@ class MissingLabel(Exception):
     def __init__(self, label: str, label2id: dict[str, int]):
         self.label = label
         self.label2id = label2id
-        self.message = (
+        super().__init__(label, label2id)
+
+    @property
+    def message(self) -> str:
+        return (
             f"One of the labels in the dataset, {self.label}, does "
             f"not occur in the label2id dictionary {self.label2id}."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class HuggingFaceHubDown(Exception):
@@ -98,16 +127,19 @@ class NoInternetConnection(Exception):
 
 class UnsupportedModelType(Exception):
     def __init__(self, model_type: str, message: str = ""):
-        if message != "":
-            self.message = message
-        else:
-            self.message = (
-                f"Received an unsupported model type: {model_type}, supported types "
-                "are `nn.Module` and `PretrainedModel`."
-            )
         self.model_type = model_type
+        self._message = message
+        super().__init__(model_type, message)
+
+    @property
+    def message(self) -> str:
+        return self._message or (
+            f"Received an unsupported model type: {self.model_type}, supported types "
+            "are `nn.Module` and `PretrainedModel`."
+        )
 
-        super().__init__(self.message)
+    def __str__(self) -> str:
+        return self.message
 
 
 class MissingCountryISOCode(Exception):
@@ -130,14 +162,20 @@ class InvalidArchitectureForTask(Exception):
     def __init__(self, architectures: list[str], supertask: str):
         self.architectures = architectures
         self.supertask = supertask
-        self.message = (
+        super().__init__(architectures, supertask)
+
+    @property
+    def message(self) -> str:
+        return (
             "The provided model-id has the following architectures: "
             f"{str(self.architectures)}, none of which fits the provided task's "
-            f"supertask: {supertask}. Please provide another model ID which is a "
-            f"{supertask}-type model, or provide another task which fits the "
+            f"supertask: {self.supertask}. Please provide another model ID which is a "
+            f"{self.supertask}-type model, or provide another task which fits the "
             f"aforementioned architectures."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class WrongFeatureColumnName(Exception):
@@ -146,11 +184,17 @@ class WrongFeatureColumnName(Exception):
             feature_column_names = [feature_column_names]
 
         self.feature_column_names = feature_column_names
-        self.message = (
+        super().__init__(self.feature_column_names)
+
+    @property
+    def message(self) -> str:
+        return (
             "The provided feature column name(s) "
             f"'{', '.join(self.feature_column_names)}' were incorrect."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class MPSFallbackNotEnabled(Exception):
@@ -168,36 +212,57 @@ class MPSFallbackNotEnabled(Exception):
 class InvalidTokenizer(Exception):
     def __init__(self, tokenizer_type: str, message: str = ""):
         self.tokenizer_type = tokenizer_type
-        self.message = (
-            message
-            if message
-            else (
-                f"The provided tokenizer type: {self.tokenizer_type} is not supported."
-            )
+        self._message = message
+        super().__init__(tokenizer_type, message)
+
+    @property
+    def message(self) -> str:
+        return self._message or (
+            f"The provided tokenizer type: {self.tokenizer_type} is not supported."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class InvalidTask(Exception):
     def __init__(self, task: str):
         self.task = task
-        self.message = f"The task '{task}' is not supported."
-        super().__init__(self.message)
+        super().__init__(task)
+
+    @property
+    def message(self) -> str:
+        return f"The task '{self.task}' is not supported."
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ModelNotTrainedForTask(Exception):
     def __init__(self, task: str):
         self.task = task
-        self.message = f"The model is not trained for the task {self.task}."
-        super().__init__(self.message)
+        super().__init__(task)
+
+    @property
+    def message(self) -> str:
+        return f"The model is not trained for the task {self.task}."
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class FrameworkCannotHandleTask(Exception):
     def __init__(self, framework: Framework | str, task: str):
         self.task = task
         self.framework = framework
-        self.message = (
-            f"Evaluation of {str(framework)} models on the {task} task is not "
-            "supported."
+        super().__init__(framework, task)
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Evaluation of {str(self.framework)} models on the {self.task} task is "
+            "not supported."
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        return self.message
@@ -1,10 +1,21 @@
 """Utility functions related to the Hugging Face Hub."""
 
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import torch
 from huggingface_hub import HfApi, ModelFilter
 from huggingface_hub.hf_api import ModelInfo
 from huggingface_hub.utils import RepositoryNotFoundError
 from huggingface_hub.utils import HFValidationError
 from requests.exceptions import RequestException
+from transformers.configuration_utils import PretrainedConfig
 from transformers.modeling_utils import PreTrainedModel
 from transformers.models.auto.configuration_auto import AutoConfig
 from transformers.models.auto.processing_auto import AutoProcessor
@@ -31,6 +42,10 @@ def load_model_from_hf_hub(
 ) -> dict[str, PreTrainedModel]:
     """Load a PyTorch model.
 
+    The model is adjusted to the task and then persisted to the cache directory, so
+    subsequent loads of the same model, revision and task skip both the Hugging Face
+    Hub download and the adjustment step.
+
     Args:
         model_config:
             The configuration of the model.
@@ -54,12 +69,48 @@ def load_model_from_hf_hub(
             If the model is private on the Hugging Face Hub, and `token` is
             not set.
     """
-    try:
-        config = AutoConfig.from_pretrained(
-            model_config.model_id,
-            revision=model_config.revision,
-            token=evaluation_config.token,
+    # Load the weight shards of the model in parallel, as these are otherwise loaded
+    # sequentially, leaving the loading of large multi-shard checkpoints I/O-bound.
+    # This only applies to PyTorch models, as the environment variables are only
+    # picked up when loading torch/safetensors shards
+    if (
+        model_config.framework == Framework.PYTORCH
+        and evaluation_config.parallel_model_loading
+    ):
+        num_workers = evaluation_config.parallel_loading_workers or min(
+            8, os.cpu_count() or 4
         )
+        os.environ.setdefault("HF_ENABLE_PARALLEL_LOADING", "true")
+        os.environ.setdefault("HF_PARALLEL_LOADING_WORKERS", str(num_workers))
+
+    # Check whether a task-adjusted version of the model has previously been persisted
+    # to the cache directory, in which case we load it from there
+    adjusted_model_dir = _adjusted_model_dir(
+        model_config=model_config,
+        task_config=task_config,
+        evaluation_config=evaluation_config,
+    )
+    cache_hit = adjusted_model_dir.is_dir()
+
+    try:
+        if cache_hit:
+            try:
+                config = AutoConfig.from_pretrained(adjusted_model_dir)
+            except OSError:
+                # The cached directory could not be read, so invalidate it and fall
+                # back to a fresh load from the Hub
+                shutil.rmtree(adjusted_model_dir, ignore_errors=True)
+                cache_hit = False
+        if not cache_hit:
+            # The configuration is copied, as the memoised configuration would
+            # otherwise be mutated when the model is adjusted to the task
+            config = deepcopy(
+                _load_autoconfig(
+                    model_id=model_config.model_id,
+                    revision=model_config.revision,
+                    token=evaluation_config.token,
+                )
+            )
 
         # Check whether the supertask is a valid one
         supertask = task_config.supertask
@@ -102,15 +153,67 @@ def load_model_from_hf_hub(
                 " AutoModel type (such as `AutoModelForSequenceClassification`)."
             )
 
-        # Load the model with the correct model class
-        model = model_cls.from_pretrained(  # type: ignore[attr-defined]
-            model_config.model_id,
-            revision=model_config.revision,
-            token=evaluation_config.token,
-            config=config,
-            cache_dir=evaluation_config.cache_dir,
-            from_flax=from_flax,
-        )
+        # Load the model with the correct model class, and fetch the tokenizer
+        # concurrently, as the tokenizer files are independent of the model weights
+        # and the two downloads can overlap
+        params = dict(use_fast=True, add_prefix_space=_add_prefix_space(config=config))
+        if cache_hit:
+            model_source = adjusted_model_dir
+            model_params: dict[str, Any] = dict(config=config, local_files_only=True)
+            tokenizer_source = adjusted_model_dir
+            tokenizer_params = dict(config=config, **params)
+        else:
+            model_source = model_config.model_id
+            model_params = dict(
+                revision=model_config.revision,
+                token=evaluation_config.token,
+                config=config,
+                cache_dir=evaluation_config.cache_dir,
+                from_flax=from_flax,
+            )
+            tokenizer_source = model_config.tokenizer_id
+            tokenizer_params = dict(
+                revision=model_config.revision,
+                token=evaluation_config.token,
+                config=config,
+                **params,
+            )
+
+        # Load the model weights in the requested dtype, if one has been set. The
+        # "int8" dtype is handled separately, as it quantizes the model after loading
+        if evaluation_config.torch_dtype not in (None, "int8"):
+            model_params["torch_dtype"] = getattr(torch, evaluation_config.torch_dtype)
+
+        # Select the attention backend, but only when one has been explicitly
+        # requested. When left unset, `transformers` already prefers scaled
+        # dot-product attention for the architectures that support it, and forcing
+        # "sdpa" makes the load fail for the architectures that do not
+        if evaluation_config.attn_implementation is not None:
+            model_params["attn_implementation"] = (
+                evaluation_config.attn_implementation
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            model_future = executor.submit(
+                model_cls.from_pretrained,  # type: ignore[attr-defined]
+                model_source,
+                **model_params,
+            )
+            tokenizer_future = executor.submit(
+                AutoTokenizer.from_pretrained,
+                tokenizer_source,
+                **tokenizer_params,
+            )
+            try:
+                model = model_future.result()
+            except TypeError:
+                # Older versions of transformers do not accept the
+                # attn_implementation argument, so retry the load without it
+                model_params.pop("attn_implementation", None)
+                model = model_cls.from_pretrained(  # type: ignore[attr-defined]
+                    model_source,
+                    **model_params,
+                )
 
     # If an error occured then throw an informative exception
     except (OSError, ValueError):
@@ -126,24 +229,17 @@ def load_model_from_hf_hub(
                 "registered."
             )
 
-    # Ensure that the model is compatible with the task
-    adjust_model_to_task(
-        model=model,
-        model_config=model_config,
-        task_config=task_config,
-    )
+    # Ensure that the model is compatible with the task. If the model was loaded from
+    # the adjusted-model cache then this has already been done
+    if not cache_hit:
+        adjust_model_to_task(
+            model=model,
+            model_config=model_config,
+            task_config=task_config,
+        )
 
-    # If the model is a subclass of a RoBERTa model then we have to add a prefix space
-    # to the tokens, by the way the model is constructed.
-    tokenizer_id = model_config.tokenizer_id
-    prefix = "Roberta" in type(model).__name__
-    params = dict(use_fast=True, add_prefix_space=prefix)
-    tokenizer = AutoTokenizer.from_pretrained(
-        tokenizer_id,
-        revision=model_config.revision,
-        token=evaluation_config.token,
-        **params,
-    )
+    # Collect the concurrently fetched tokenizer
+    tokenizer = tokenizer_future.result()
 
     # Try to load a processor from the model id, if it does not exist, then set
     # processor to None
@@ -159,25 +255,165 @@ def load_model_from_hf_hub(
 
     # Set the maximal length of the tokenizer to the model's maximal length. This is
     # required for proper truncation
-    if not hasattr(tokenizer, "model_max_length") or tokenizer.model_max_length > 1_000:
-        if hasattr(tokenizer, "max_model_input_sizes"):
-            all_max_lengths = tokenizer.max_model_input_sizes.values()
-            if len(list(all_max_lengths)) > 0:
-                min_max_length = min(list(all_max_lengths))
-                tokenizer.model_max_length = min_max_length
-            else:
-                tokenizer.model_max_length = 512
+    model_max_length = getattr(tokenizer, "model_max_length", None)
+    if model_max_length is None or model_max_length > 1_000:
+        # Resolve the maximal length from the model configuration when present, which
+        # avoids walking the tokenizer's mapping of the maximal lengths of every
+        # pretrained variant. The value is clamped to 512, as some architectures,
+        # such as the RoBERTa family, offset their position ids past the padding
+        # index, making the usable sequence length shorter than the number of
+        # position embeddings
+        model_max_length = getattr(config, "max_position_embeddings", None)
+        if model_max_length:
+            model_max_length = min(model_max_length, 512)
         else:
-            tokenizer.model_max_length = 512
+            all_max_lengths = getattr(tokenizer, "max_model_input_sizes", None) or {}
+            model_max_length = min(all_max_lengths.values(), default=512)
+            if model_max_length > 1_000:
+                model_max_length = 512
+        tokenizer.model_max_length = model_max_length
+
+    # Persist the task-adjusted model and tokenizer to the cache directory, so
+    # subsequent loads for the same model, revision and task skip the Hub download
+    # and the adjustment step. The files are saved to a temporary sibling directory
+    # which is renamed into place afterwards, so an interrupted save cannot leave a
+    # half-written directory that would later be treated as a valid cache hit
+    if not cache_hit:
+        tmp_adjusted_model_dir = adjusted_model_dir.with_name(
+            f"{adjusted_model_dir.name}.tmp"
+        )
+        shutil.rmtree(tmp_adjusted_model_dir, ignore_errors=True)
+        tmp_adjusted_model_dir.mkdir(parents=True)
+        model.save_pretrained(tmp_adjusted_model_dir)
+        tokenizer.save_pretrained(tmp_adjusted_model_dir)
+        try:
+            os.replace(tmp_adjusted_model_dir, adjusted_model_dir)
+        except OSError:
+            # Another process finished saving the same model first, so discard our
+            # copy and keep theirs
+            shutil.rmtree(tmp_adjusted_model_dir, ignore_errors=True)
 
     model.eval()
-    model.to(evaluation_config.device)
+    device = evaluation_config.device
+
+    # Quantize the linear layers of the model to int8, if requested. Dynamic
+    # quantization only takes effect on CPU, so it is skipped on other devices
+    if evaluation_config.torch_dtype == "int8" and device == "cpu":
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    model.to(device)
+
+    # Compile the model, if requested, so repeated inference batches run through the
+    # fused kernel path. The first batch triggers the compilation, and since loaded
+    # models are kept in the in-memory model cache, subsequent loads of the same
+    # model skip the warmup
+    if evaluation_config.compile and hasattr(torch, "compile"):
+        model = torch.compile(model, mode="reduce-overhead", dynamic=False)
 
     return dict(
         model=model, tokenizer=tokenizer, processor=processor, model_type="huggingface"
     )
 
 
+def _adjusted_model_dir(
+    model_config: ModelConfig,
+    task_config: TaskConfig,
+    evaluation_config: EvaluationConfig,
+) -> Path:
+    """The directory in which the task-adjusted version of a model is cached.
+
+    Args:
+        model_config:
+            The configuration of the model.
+        task_config:
+            The task configuration.
+        evaluation_config:
+            The evaluation configuration.
+
+    Returns:
+        The directory in which the task-adjusted version of the model is cached. The
+        directory does not necessarily exist yet.
+    """
+    # The dtype is part of the cache key, as loading in a reduced precision rounds
+    # the weights before they are saved, so a full-precision run must not pick up a
+    # cache entry written by a reduced-precision run
+    cache_key = hashlib.sha256(
+        "|".join(
+            [
+                model_config.model_id,
+                model_config.revision,
+                task_config.name,
+                str(evaluation_config.torch_dtype),
+            ]
+        ).encode()
+    ).hexdigest()
+    return Path(evaluation_config.cache_dir) / "adjusted_models" / cache_key
+
+
+def _add_prefix_space(config: PretrainedConfig) -> bool:
+    """Whether a prefix space should be added to the tokens.
+
+    If the model is a subclass of a RoBERTa model then a prefix space has to be added
+    to the tokens, by the way the model is constructed. This is decided from the
+    architectures listed in the model configuration, so that the tokenizer can be set
+    up before the model has been materialised.
+
+    Args:
+        config:
+            The model configuration.
+
+    Returns:
+        Whether a prefix space should be added to the tokens.
+    """
+    return any(
+        "Roberta" in architecture for architecture in (config.architectures or [])
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_autoconfig(
+    model_id: str,
+    revision: str,
+    token: bool | str,
+) -> PretrainedConfig:
+    """Load a model configuration from the Hugging Face Hub, with memoisation.
+
+    The memoisation means that evaluating the same model on several tasks only
+    downloads the configuration once per process.
+
+    Args:
+        model_id:
+            The Hugging Face ID of the model.
+        revision:
+            The revision of the model.
+        token:
+            The authentication token for the Hugging Face Hub. If a boolean value is
+            specified then the token will be fetched from the Hugging Face CLI, where
+            the user has logged in through `huggingface-cli login`. If a string is
+            specified then it will be used as the token.
+
+    Returns:
+        The model configuration.
+    """
+    # Attempt to load the configuration from the local Hugging Face cache first, to
+    # avoid a round-trip to the Hub when it has already been downloaded
+    try:
+        return AutoConfig.from_pretrained(
+            model_id,
+            revision=revision,
+            token=token,
+            local_files_only=True,
+        )
+    except OSError:
+        return AutoConfig.from_pretrained(
+            model_id,
+            revision=revision,
+            token=token,
+        )
+
+
 def get_hf_hub_model_info(
     model_id: str,
     token: bool | str,
@@ -1,5 +1,11 @@
 """Main loading functions."""
 
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
 from typing import Any
 
 from .config import EvaluationConfig, ModelConfig, TaskConfig
@@ -26,6 +32,19 @@ from .spacy_utils import (
     load_spacy_model,
     model_exists_on_spacy,
 )
+from .utils import is_module_installed
+
+logger = logging.getLogger(__name__)
+
+
+# In-memory cache of loaded models. Repeated evaluations of the same model, such as
+# when a worker evaluates a model on the same task several times, reuse the
+# already-loaded model instead of paying the full download and initialisation cost
+# again. Loading is serialised behind a per-model lock, as `from_pretrained` is not
+# reentrant-safe for the same model when two threads share the same cache directory,
+# while loads of different models can proceed concurrently
+_MODEL_CACHE: dict[tuple, dict[str, Any]] = {}
+_MODEL_CACHE_LOCKS: defaultdict[tuple, threading.Lock] = defaultdict(threading.Lock)
 
 
 def load_model(
@@ -35,6 +54,10 @@ def load_model(
 ) -> dict[str, Any]:
     """Load the model.
 
+    The loaded model is kept in an in-memory cache, so subsequent calls with the same
+    model, revision, framework, device, task and model-shaping evaluation settings
+    return the cached model.
+
     Args:
         model_config:
             The model configuration.
@@ -51,12 +74,145 @@ def load_model(
         InvalidFramework:
             If the framework is not recognized.
     """
+    # Route all downloads from the Hugging Face Hub through the Rust-based
+    # `hf_transfer` package, if fast downloads have been requested. This applies to
+    # both the model weights and the spaCy model wheels. The package is an optional
+    # dependency, and `huggingface_hub` raises an error mid-download if the
+    # environment variable is set without it being installed, so fall back to the
+    # standard download path if it is missing
+    if evaluation_config.fast_download:
+        if is_module_installed("hf_transfer"):
+            os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+        else:
+            logger.warning(
+                "Fast downloads were requested, but the `hf_transfer` package is "
+                "not installed, so the standard download path is used instead. "
+                "Install it with `pip install alexandra-ai-eval[fast_download]` to "
+                "enable fast downloads."
+            )
+
     # If the framework is JAX then change it to PyTorch, since we will convert JAX
     # models to PyTorch upon download
     from_flax = model_config.framework == Framework.JAX
     if model_config.framework == Framework.JAX:
         model_config.framework = Framework.PYTORCH
 
+    # The task is part of the cache key, as the loaded model is adjusted to the task,
+    # and so are the evaluation settings which shape the loaded model
+    cache_key = (
+        model_config.model_id,
+        model_config.revision,
+        str(model_config.framework),
+        evaluation_config.device,
+        task_config.name,
+        evaluation_config.torch_dtype,
+        evaluation_config.attn_implementation,
+        evaluation_config.compile,
+    )
+    with _MODEL_CACHE_LOCKS[cache_key]:
+        if cache_key not in _MODEL_CACHE:
+            _MODEL_CACHE[cache_key] = _load_fresh_model(
+                model_config=model_config,
+                task_config=task_config,
+                evaluation_config=evaluation_config,
+                from_flax=from_flax,
+            )
+
+        # Return a shallow copy of the cached dictionary, so callers can add or
+        # remove entries without affecting the cache
+        return dict(_MODEL_CACHE[cache_key])
+
+
+def load_models(
+    model_and_task_configs: list[tuple[ModelConfig, TaskConfig]],
+    evaluation_config: EvaluationConfig,
+) -> list[dict[str, Any]]:
+    """Load several models concurrently.
+
+    Loading a model is I/O-bound, so dispatching the loads through a thread pool
+    overlaps their network latency. The number of workers is capped at 8, or at the
+    value of the `HF_PARALLEL_LOADING_WORKERS` environment variable if set, to avoid
+    saturating the connection.
+
+    Args:
+        model_and_task_configs:
+            The configurations of the models to load, along with the configurations
+            of the tasks they will be evaluated on.
+        evaluation_config:
+            The evaluation configuration.
+
+    Returns:
+        The loaded models, in the same order as the supplied configurations.
+    """
+    if not model_and_task_configs:
+        return []
+
+    num_workers = min(
+        int(os.environ.get("HF_PARALLEL_LOADING_WORKERS", 8)),
+        len(model_and_task_configs),
+    )
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(
+            executor.map(
+                lambda configs: load_model(
+                    model_config=configs[0],
+                    task_config=configs[1],
+                    evaluation_config=evaluation_config,
+                ),
+                model_and_task_configs,
+            )
+        )
+
+
+def preload_models(
+    model_and_task_configs: list[tuple[ModelConfig, TaskConfig]],
+    evaluation_config: EvaluationConfig,
+) -> None:
+    """Preload models into the in-memory cache.
+
+    This is intended to be called once at worker startup, such as when serving
+    evaluations from a web server, so the models are resident before the first
+    request arrives.
+
+    Args:
+        model_and_task_configs:
+            The configurations of the models to preload, along with the
+            configurations of the tasks they will be evaluated on.
+        evaluation_config:
+            The evaluation configuration.
+    """
+    load_models(
+        model_and_task_configs=model_and_task_configs,
+        evaluation_config=evaluation_config,
+    )
+
+
+def _load_fresh_model(
+    model_config: ModelConfig,
+    task_config: TaskConfig,
+    evaluation_config: EvaluationConfig,
+    from_flax: bool,
+) -> dict[str, Any]:
+    """Load a model, bypassing the in-memory cache.
+
+    Args:
+        model_config:
+            The model configuration.
+        task_config:
+            The task configuration.
+        evaluation_config:
+            The evaluation configuration.
+        from_flax:
+            Whether the model is a Flax model.
+
+    Returns:
+        A dictionary containing at least the key 'model', with the value being the
+        model. Can contain other objects related to the model, such as its tokenizer.
+
+    Raises:
+        InvalidFramework:
+            If the framework is not recognized.
+    """
     if model_config.framework == Framework.PYTORCH:
         model_on_hf_hub = model_exists_on_hf_hub(
             model_id=model_config.model_id,
@@ -85,12 +241,43 @@ def load_model(
             raise ModelDoesNotExist(model_id=model_config.model_id)
 
     elif model_config.framework == Framework.SPACY:
-        return load_spacy_model(model_id=model_config.model_id)
+        return load_spacy_model(
+            model_id=model_config.model_id, task_config=task_config
+        )
 
     else:
         raise InvalidFramework(model_config.framework)
 
 
+class TemporaryModelCache:
+    """Context manager that redirects the model cache to a temporary directory.
+
+    This is useful for one-off evaluations, where the models cached to disk should
+    not persist after the evaluation has finished.
+
+    Args:
+        evaluation_config:
+            The evaluation configuration whose cache directory should be redirected.
+    """
+
+    def __init__(self, evaluation_config: EvaluationConfig):
+        self.evaluation_config = evaluation_config
+        self._original_cache_dir: str | None = None
+        self._tmp_dir: TemporaryDirectory | None = None
+
+    def __enter__(self) -> "TemporaryModelCache":
+        self._tmp_dir = TemporaryDirectory()
+        self._original_cache_dir = self.evaluation_config.cache_dir
+        self.evaluation_config.cache_dir = self._tmp_dir.name
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._original_cache_dir is not None:
+            self.evaluation_config.cache_dir = self._original_cache_dir
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+
+
 def get_model_config(
     model_id: str, task_config: TaskConfig, evaluation_config: EvaluationConfig
 ) -> ModelConfig:
@@ -1,29 +1,71 @@
 """Utility functions related to the spaCy library."""
 
+import importlib
+import os
+import shutil
+import sys
 import warnings
-from subprocess import CalledProcessError
+from pathlib import Path
+from subprocess import CalledProcessError, run
+from tempfile import mkdtemp
 
+import requests
 import spacy
-from spacy.cli.download import download as download_spacy
+from huggingface_hub import hf_hub_download
+from huggingface_hub.utils import (
+    EntryNotFoundError,
+    HFValidationError,
+    RepositoryNotFoundError,
+)
+from requests.exceptions import RequestException
+from spacy import about
+from spacy.cli.download import get_compatibility, get_version
 from spacy.language import Language
 
-from .config import ModelConfig
+from .config import ModelConfig, TaskConfig
 from .enums import Framework
 from .exceptions import ModelFetchFailed
 from .utils import is_module_installed
 
 
-# Ignore warnings from spaCy. This has to be called after the import, as the
-# __init__.py file of spaCy sets the warning levels of spaCy warning W036
-warnings.filterwarnings("ignore", module="spacy*")
+# The spaCy pipeline components that each supertask needs. All other components are
+# excluded when loading a model for the supertask, so their weights are not even read
+# from disk
+_REQUIRED_PIPELINE_COMPONENTS = {
+    "token-classification": ["tok2vec", "transformer", "ner", "entity_ruler"],
+    "sequence-classification": ["tok2vec", "transformer", "textcat"],
+}
 
+# All the pipeline components that can appear in the pretrained spaCy pipelines
+_ALL_PIPELINE_COMPONENTS = [
+    "tok2vec",
+    "transformer",
+    "tagger",
+    "morphologizer",
+    "parser",
+    "lemmatizer",
+    "attribute_ruler",
+    "senter",
+    "sentencizer",
+    "ner",
+    "textcat",
+    "entity_ruler",
+]
 
-def load_spacy_model(model_id: str) -> dict[str, Language]:
+
+def load_spacy_model(
+    model_id: str, task_config: TaskConfig | None = None
+) -> dict[str, Language]:
     """Load a spaCy model.
 
     Args:
         model_id:
             The ID of the model.
+        task_config:
+            The configuration of the task the model will be evaluated on. If not None
+            then the pipeline components which the task does not need are excluded
+            when loading the model, saving both loading time and memory. Defaults to
+            None.
 
     Returns:
         A dictionary containing at least the key 'model', with the value being the
@@ -35,23 +77,60 @@ def load_spacy_model(model_id: str) -> dict[str, Language]:
     """
     local_model_id = model_id.split("/")[-1]
 
-    # Download the model if it has not already been so
-    try:
-        if not is_module_installed(local_model_id):
-            try:
-                download_spacy(model=local_model_id)
+    # All spaCy models are published on the Hugging Face Hub under the `spacy`
+    # organisation, so if no organisation was specified then we default to that one
+    repo_id = model_id if "/" in model_id else f"spacy/{local_model_id}"
+
+    # Download and install the model if it has not already been so. The model wheel is
+    # fetched through `hf_hub_download`, meaning that it ends up in the shared Hugging
+    # Face cache and benefits from `hf_transfer` when fast downloads are enabled
+    if not is_module_installed(local_model_id):
+        try:
+            wheel_path = hf_hub_download(
+                repo_id=repo_id,
+                filename=f"{local_model_id}-any-py3-none-any.whl",
+                cache_dir=os.environ.get("HUGGINGFACE_HUB_CACHE"),
+            )
+        except (EntryNotFoundError, HFValidationError, RepositoryNotFoundError):
+            # The wheel is not available on the Hugging Face Hub, or the model ID is
+            # not a valid repo ID at all, such as a path to a local model, so fall
+            # back to downloading it directly from the spaCy release page. For
+            # non-spaCy IDs this raises ModelFetchFailed, which the existence probe
+            # in `model_exists_on_spacy` converts into a negative answer
+            wheel_path = _download_wheel_directly(local_model_id=local_model_id)
 
-            # The download function calls a `sys.exit` at the end of the download, so
-            # we catch that here and move on
-            except SystemExit:
-                pass
+        _install_wheel(wheel_path=wheel_path, local_model_id=local_model_id)
 
-    except CalledProcessError as e:
-        raise ModelFetchFailed(model_id=local_model_id, error_msg=e.output)
+        # The module probe memoises its answers, so reset it now that a new module
+        # has been installed. The import system's finder caches must be invalidated
+        # as well, as the wheel was installed within this process, and the finders
+        # may otherwise not see the newly created package directory
+        is_module_installed.cache_clear()
+        importlib.invalidate_caches()
 
-    # Load the model
+    # Exclude the pipeline components which the task does not need, so their weights
+    # are not loaded at all. Excluded components which do not appear in the pipeline
+    # are ignored by spaCy
+    exclude: list[str] = []
+    if task_config is not None:
+        required_components = _REQUIRED_PIPELINE_COMPONENTS.get(task_config.supertask)
+        if required_components is not None:
+            exclude = [
+                component
+                for component in _ALL_PIPELINE_COMPONENTS
+                if component not in required_components
+            ]
+
+    # Load the model. Warnings from spaCy, such as W036 about empty pipeline
+    # components, are only suppressed for the duration of the load, instead of
+    # installing a process-wide warning filter. Note that the `module` argument is a
+    # regular expression, not a glob
     try:
-        model = spacy.load(local_model_id)
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", category=UserWarning, module=r"spacy(\..*)?"
+            )
+            model = spacy.load(local_model_id, exclude=exclude)
     except OSError as e:
         raise ModelFetchFailed(
             model_id=model_id,
@@ -64,6 +143,90 @@ def load_spacy_model(model_id: str) -> dict[str, Language]:
     return dict(model=model, model_type="other")
 
 
+def _download_wheel_directly(local_model_id: str) -> str:
+    """Download a spaCy model wheel from the spaCy release page.
+
+    This is used as a fallback when the wheel is not available on the Hugging Face
+    Hub. The wheel is streamed to disk in 128 KiB chunks, which reduces the number of
+    user-space/kernel transitions compared to the default chunk size.
+
+    Args:
+        local_model_id:
+            The ID of the model, without any organisation prefix.
+
+    Returns:
+        The path to the downloaded wheel.
+
+    Raises:
+        ModelFetchFailed:
+            If the model could not be downloaded.
+    """
+    # Resolve the model version which is compatible with the installed spaCy version.
+    # The spaCy helpers exit the process if the model is unknown, so we convert that
+    # into a proper exception
+    try:
+        version = get_version(local_model_id, get_compatibility())
+    except SystemExit as e:
+        raise ModelFetchFailed(model_id=local_model_id, error_msg=str(e))
+
+    filename = f"{local_model_id}-{version}-py3-none-any.whl"
+    url = f"{about.__download_url__}/{local_model_id}-{version}/{filename}"
+    wheel_path = Path(mkdtemp()) / filename
+    try:
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            with wheel_path.open("wb") as f:
+                shutil.copyfileobj(response.raw, f, length=131_072)
+    except RequestException as e:
+        raise ModelFetchFailed(model_id=local_model_id, error_msg=str(e))
+
+    return str(wheel_path)
+
+
+def _install_wheel(wheel_path: str, local_model_id: str) -> None:
+    """Install a downloaded spaCy model wheel.
+
+    The wheel is installed in-process through pip's internal entry point, which avoids
+    spawning a new interpreter for every model install. If that entry point is not
+    available then a subprocess running the same interpreter as this process is used
+    instead.
+
+    The wheel is installed without its dependencies, as these are already covered by
+    this package's own dependency on spaCy.
+
+    Args:
+        wheel_path:
+            The path to the downloaded wheel.
+        local_model_id:
+            The ID of the model, without any organisation prefix.
+
+    Raises:
+        ModelFetchFailed:
+            If the model could not be installed.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+
+        exit_code = pip_main(["install", "--no-deps", "--quiet", wheel_path])
+    except (ImportError, SystemExit):
+        exit_code = 1
+
+    # Fall back to installing the wheel in a subprocess. This uses the interpreter
+    # running this process, as `pip3` can resolve to a different Python installation
+    if exit_code != 0:
+        try:
+            run(
+                [sys.executable, "-m", "pip", "install", "--no-deps", wheel_path],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except CalledProcessError as e:
+            raise ModelFetchFailed(
+                model_id=local_model_id, error_msg=e.stderr or e.output
+            )
+
+
 def model_exists_on_spacy(model_id: str) -> bool:
     """Checks if a model exists as a spaCy model.
 
@@ -2,14 +2,15 @@
 
 import gc
 import importlib
+import importlib.util
 import logging
 import os
 import random
 import re
 import warnings
+from functools import lru_cache
 
 import numpy as np
-import pkg_resources
 import requests
 import torch
 from datasets.utils import disable_progress_bar
@@ -89,12 +90,18 @@ def enforce_reproducibility(
     return rng
 
 
+@lru_cache(maxsize=None)
 def is_module_installed(module: str) -> bool:
     """Check if a module is installed.
 
     This is used when dealing with spaCy models, as these are installed as separate
     Python packages.
 
+    The check only resolves the location of the module, without executing it, and the
+    answer is memoised for the lifetime of the process. If a module has been installed
+    after a negative answer then the cache can be reset with
+    `is_module_installed.cache_clear()`.
+
     Args:
         module:
             The name of the module.
@@ -102,18 +109,11 @@ def is_module_installed(module: str) -> bool:
     Returns:
         Whether the module is installed or not.
     """
-    # Get list of all modules, including their versions
-    installed_modules_with_versions = list(pkg_resources.working_set)
-
-    # Strip the module versions from the list of modules. Also make the modules lower
-    # case and replace dashes with underscores
-    installed_modules = [
-        re.sub("[0-9. ]", "", str(module)).lower().replace("-", "_")
-        for module in installed_modules_with_versions
-    ]
+    # Make the module name lower case and replace dashes with underscores, to convert
+    # package names to module names
+    module = module.lower().replace("-", "_")
 
-    # Check if the module is installed by checking if the module name is in the list
-    return module.lower() in installed_modules
+    return importlib.util.find_spec(module) is not None
 
 
 def block_terminal_output():
@@ -257,32 +257,59 @@ def get_class_by_name(
 
     # Loop over the class names
     for name in class_name:
-        # Get the snake_case and PascalCase version of the class name
-        name_snake = name.replace("-", "_")
-        name_pascal = kebab_to_pascal(name)
-
-        # Import the module
-        try:
-            if not module_name:
-                module_name = f"alexandra_ai_eval.{name_snake}"
-            module = importlib.import_module(module_name)
-        except ModuleNotFoundError:
-            module_name = None
-            continue
-
-        # Get the class from the module
-        try:
-            class_ = getattr(module, name_pascal)
-        except AttributeError:
-            module_name = None
-            continue
-
-        return class_
+        class_ = _get_class_by_single_name(class_name=name, module_name=module_name)
+        if class_ is not None:
+            return class_
+
+        # If the class could not be found in the given module then fall back to the
+        # default module for the remaining class names
+        module_name = None
 
     # If the class could not be found, return None
     return None
 
 
+@lru_cache(maxsize=64)
+def _get_class_by_single_name(
+    class_name: str,
+    module_name: str | None,
+) -> type | None:
+    """Get a class by its name, with the resolution memoised.
+
+    The memoisation means that repeated lookups of the same class, such as the Hugging
+    Face AutoModel classes looked up on every model load, skip the module import and
+    attribute walk.
+
+    Args:
+        class_name:
+            The name of the class, written in kebab-case.
+        module_name:
+            The name of the module where the class is located. If None then the module
+            name is assumed to be the same as the class name, but written in
+            snake_case.
+
+    Returns:
+        The class. If the class is not found, None is returned.
+    """
+    # Get the snake_case and PascalCase version of the class name
+    name_snake = class_name.replace("-", "_")
+    name_pascal = kebab_to_pascal(class_name)
+
+    # Import the module
+    try:
+        if not module_name:
+            module_name = f"alexandra_ai_eval.{name_snake}"
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError:
+        return None
+
+    # Get the class from the module
+    try:
+        return getattr(module, name_pascal)
+    except AttributeError:
+        return None
+
+
 def kebab_to_pascal(kebab_string: str) -> str:
     """Converts a kebab-case string to PascalCase.
 
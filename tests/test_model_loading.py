@@ -6,8 +6,9 @@ import pytest
 
 from alexandra_ai_eval.exceptions import InvalidFramework, ModelDoesNotExist
 from alexandra_ai_eval.hf_hub_utils import get_model_config_from_hf_hub
-from alexandra_ai_eval.model_loading import get_model_config, load_model
+from alexandra_ai_eval.model_loading import get_model_config, load_model, load_models
 from alexandra_ai_eval.spacy_utils import get_model_config_from_spacy
+from alexandra_ai_eval.task_configs import get_all_task_configs
 
 
 class TestLoadModel:
@@ -34,6 +35,81 @@ class TestLoadModel:
                 )
 
 
+class TestModelCache:
+    @pytest.fixture(scope="class")
+    def sentiment_task_configs(self):
+        task_configs = get_all_task_configs()
+        yield (
+            task_configs["sentiment-binary-classification"],
+            task_configs["sentiment-trinary-classification"],
+        )
+
+    def test_repeated_loads_share_the_model(
+        self, model_configs, task_config, evaluation_config
+    ):
+        for model_config in model_configs:
+            first = load_model(
+                model_config=model_config,
+                task_config=task_config,
+                evaluation_config=evaluation_config,
+            )
+            second = load_model(
+                model_config=model_config,
+                task_config=task_config,
+                evaluation_config=evaluation_config,
+            )
+            assert first is not second
+            assert first["model"] is second["model"]
+
+    def test_distinct_tasks_get_distinct_models(
+        self, sentiment_task_configs, evaluation_config
+    ):
+        binary_task_config, trinary_task_config = sentiment_task_configs
+        model_config = get_model_config(
+            model_id="pin/senda",
+            task_config=trinary_task_config,
+            evaluation_config=evaluation_config,
+        )
+        trinary_model = load_model(
+            model_config=model_config,
+            task_config=trinary_task_config,
+            evaluation_config=evaluation_config,
+        )["model"]
+        binary_model = load_model(
+            model_config=model_config,
+            task_config=binary_task_config,
+            evaluation_config=evaluation_config,
+        )["model"]
+        assert binary_model is not trinary_model
+
+
+class TestLoadModels:
+    def test_models_are_returned_in_input_order(
+        self, model_configs, task_config, evaluation_config
+    ):
+        model_and_task_configs = [
+            (model_config, task_config) for model_config in model_configs
+        ]
+        models = load_models(
+            model_and_task_configs=model_and_task_configs,
+            evaluation_config=evaluation_config,
+        )
+        assert len(models) == len(model_configs)
+        for model_config, model in zip(model_configs, models):
+            cached_model = load_model(
+                model_config=model_config,
+                task_config=task_config,
+                evaluation_config=evaluation_config,
+            )
+            assert model["model"] is cached_model["model"]
+
+    def test_empty_input_gives_empty_output(self, evaluation_config):
+        models = load_models(
+            model_and_task_configs=[], evaluation_config=evaluation_config
+        )
+        assert models == []
+
+
 class TestGetModelConfig:
     @pytest.fixture(scope="class")
     def hf_model_id(self):